@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN
@@ -15,9 +19,98 @@ from .mpp_solar_api import MPPSolarAPI
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR, Platform.BINARY_SENSOR)
 SCAN_INTERVAL = timedelta(seconds=30)
 
+# Rating data (QPIRI) rarely changes - refresh it every N polls (10 min)
+# instead of paying the extra serial round-trip on every tick
+RATING_REFRESH_TICKS = 20
+
+
+async def _async_update_data(
+    hass: HomeAssistant,
+    api: MPPSolarAPI,
+    executor: ThreadPoolExecutor,
+    cycle_state: dict,
+):
+    """Fetch data from API endpoint (one poll cycle)."""
+    try:
+        data = await hass.loop.run_in_executor(executor, api.get_runtime_data)
+
+        # get_runtime_data swallows I/O errors and returns empty dicts, so
+        # the emptiness check must run before the cached rating data is
+        # merged in - after the first successful rating fetch that merge
+        # would keep the values non-empty forever and a dead device would
+        # still report update success on every tick
+        if not data["values"]:
+            _LOGGER.warning("No data received from device")
+            # Don't fail immediately, try to get at least basic info
+            try:
+                device_info = await hass.loop.run_in_executor(
+                    executor, api.get_device_info
+                )
+                if device_info:
+                    _LOGGER.debug("Got device info: %s", device_info)
+                    return {
+                        "values": {"device_info_only": device_info},
+                        "units": {"device_info_only": ""},
+                    }
+            except Exception as e:
+                _LOGGER.error("Failed to get device info: %s", e)
+            raise UpdateFailed("No data received from device")
+
+        # Refresh the slow rating data only on the first poll and every
+        # RATING_REFRESH_TICKS thereafter; reuse the cached dicts otherwise
+        tick = cycle_state["tick"]
+        cycle_state["tick"] = tick + 1
+        if tick % RATING_REFRESH_TICKS == 0:
+            try:
+                ratings = await hass.loop.run_in_executor(
+                    executor, api.get_rating_data
+                )
+                if ratings["values"]:
+                    cycle_state["rating_values"] = ratings["values"]
+                    cycle_state["rating_units"] = ratings["units"]
+            except Exception as e:
+                _LOGGER.warning("Failed to refresh rating data: %s", e)
+
+        data["values"].update(cycle_state["rating_values"])
+        data["units"].update(cycle_state["rating_units"])
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Data update successful, received %d values: %s",
+                len(data["values"]),
+                list(data["values"]),
+            )
+
+        return data
+    except Exception as err:
+        _LOGGER.error("Error communicating with API: %s", err)
+        raise UpdateFailed(f"Error communicating with API: {err}")
+
+
+async def _async_refresh_device_info(
+    hass: HomeAssistant,
+    api: MPPSolarAPI,
+    executor: ThreadPoolExecutor,
+    store: Store,
+    cached: dict,
+) -> None:
+    """Re-read device info in the background and persist it if changed.
+
+    Runs after setup served the stored copy, so a changed serial number
+    or firmware version is picked up on the next reload without the
+    startup path ever waiting on the device.
+    """
+    try:
+        fresh = await hass.loop.run_in_executor(executor, api.get_device_info)
+    except Exception as e:
+        _LOGGER.debug("Background device info refresh failed: %s", e)
+        return
+    if fresh and fresh != cached:
+        await store.async_save(fresh)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MPP Solar from a config entry."""
@@ -30,102 +123,99 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         device_path=entry.data["device_path"],
         protocol=entry.data.get("protocol", "PI30"),
     )
-    
-    # Test connection multiple times if needed
-    _LOGGER.info("🔍 Testing connection to device...")
-    connection_attempts = 3
-    connected = False
-    
-    for attempt in range(connection_attempts):
-        try:
-            _LOGGER.info("📞 Connection attempt %d/%d", attempt + 1, connection_attempts)
-            connected = await hass.async_add_executor_job(api.test_connection)
-            if connected:
-                _LOGGER.info("✅ Successfully connected to device on attempt %d", attempt + 1)
-                break
-            else:
-                _LOGGER.warning("❌ Connection test returned False on attempt %d", attempt + 1)
-                if attempt < connection_attempts - 1:
-                    await asyncio.sleep(2)
-        except Exception as e:
-            _LOGGER.error("💥 Connection test failed on attempt %d: %s", attempt + 1, e)
-            if attempt < connection_attempts - 1:
-                await asyncio.sleep(2)
-    
-    if not connected:
-        _LOGGER.error("🚫 Failed to connect after %d attempts", connection_attempts)
-        return False
-
-    async def async_update_data():
-        """Fetch data from API endpoint."""
-        try:
-            _LOGGER.debug("📊 Fetching data from MPP Solar device")
-            data = await hass.async_add_executor_job(api.get_all_data)
-            
-            if not data:
-                _LOGGER.warning("📭 No data received from device")
-                # Don't fail immediately, try to get at least basic info
-                try:
-                    device_info = await hass.async_add_executor_job(api.get_device_info)
-                    if device_info:
-                        _LOGGER.info("📄 Got device info: %s", device_info)
-                        return {"device_info_only": (device_info, "")}
-                except Exception as e:
-                    _LOGGER.error("💥 Failed to get device info: %s", e)
-                raise UpdateFailed("No data received from device")
-            
-            _LOGGER.info("📈 Data update successful! Received %d values", len(data))
-            _LOGGER.debug("🔍 Data keys: %s", list(data.keys()))
-            
-            # Log some sample data for debugging
-            for i, (key, value) in enumerate(data.items()):
-                if i < 5:  # Log first 5 items
-                    _LOGGER.debug("📊 Sample data [%s]: %s", key, value)
-                    
-            return data
-        except Exception as err:
-            _LOGGER.error("💥 Error communicating with API: %s", err)
-            raise UpdateFailed(f"Error communicating with API: {err}")
-
-    # Create coordinator
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="mpp_solar",
-        update_method=async_update_data,
-        update_interval=SCAN_INTERVAL,
+
+    # One long-lived worker thread owns all blocking device I/O. Reusing a
+    # dedicated executor avoids per-poll dispatch into HA's shared pool and
+    # naturally serializes access to the half-duplex serial port.
+    executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix=f"mpp_solar_{entry.entry_id}"
     )
 
-    # Fetch initial data - retry if needed
-    _LOGGER.info("📥 Fetching initial data...")
-    initial_attempts = 3
-    
-    for attempt in range(initial_attempts):
-        try:
-            _LOGGER.info("📦 Initial data attempt %d/%d", attempt + 1, initial_attempts)
+    def _run_in_device_thread(func):
+        return hass.loop.run_in_executor(executor, func)
+
+    try:
+        # Test connection with short exponential backoff between attempts
+        _LOGGER.info("🔍 Testing connection to device...")
+        connected = False
+
+        for attempt, delay in enumerate((0.0, 0.2, 0.4), start=1):
+            # Back off before the retries, never after the last attempt -
+            # a trailing sleep would only delay the ConfigEntryNotReady
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                _LOGGER.info("📞 Connection attempt %d", attempt)
+                connected = await _run_in_device_thread(api.test_connection)
+                if connected:
+                    _LOGGER.info("✅ Successfully connected to device on attempt %d", attempt)
+                    break
+                _LOGGER.warning("❌ Connection test returned False on attempt %d", attempt)
+            except Exception as e:
+                _LOGGER.error("💥 Connection test failed on attempt %d: %s", attempt, e)
+
+        if not connected:
+            # Let HA reschedule setup with its own backoff instead of
+            # failing the entry outright
+            raise ConfigEntryNotReady(
+                f"Could not connect to MPP Solar device at {entry.data['device_path']}"
+            )
+
+        # Create coordinator - partial() avoids building a fresh closure
+        # with cell variables for every entry setup
+        cycle_state = {"tick": 0, "rating_values": {}, "rating_units": {}}
+        coordinator = DataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name="mpp_solar",
+            update_method=partial(_async_update_data, hass, api, executor, cycle_state),
+            update_interval=SCAN_INTERVAL,
+        )
+
+        # Device info (serial number, firmware) is effectively static, so a
+        # stored copy from a previous run is served immediately and
+        # re-checked in the background (stale-while-revalidate) instead of
+        # paying a serial round-trip on every startup. The platforms read
+        # device_info from hass.data instead of re-querying the device.
+        store = Store(hass, 1, f"{DOMAIN}_device_info_{entry.entry_id}")
+        device_info = await store.async_load()
+
+        if device_info:
+            _LOGGER.debug("📥 Using stored device info, refreshing in background")
             await coordinator.async_config_entry_first_refresh()
-            _LOGGER.info("✅ Initial data fetch successful!")
-            break
-        except Exception as e:
-            _LOGGER.warning("⚠️ Initial data fetch failed on attempt %d: %s", attempt + 1, e)
-            if attempt < initial_attempts - 1:
-                await asyncio.sleep(3)
-            else:
-                _LOGGER.error("🚫 Failed to get initial data after %d attempts", initial_attempts)
-                return False
-
-    # Verify we have data
-    if not coordinator.data:
-        _LOGGER.error("🚫 No data available after successful fetch - this shouldn't happen")
-        return False
-        
-    _LOGGER.info("📊 Setup complete! Data available: %d items", len(coordinator.data))
+            hass.async_create_task(
+                _async_refresh_device_info(hass, api, executor, store, device_info)
+            )
+        else:
+            # First run for this entry - fetch device info and initial data
+            # concurrently; the first refresh raises ConfigEntryNotReady on
+            # failure and HA retries with its own backoff
+            _LOGGER.info("📥 Fetching device info and initial data...")
+            device_info, _ = await asyncio.gather(
+                _run_in_device_thread(api.get_device_info),
+                coordinator.async_config_entry_first_refresh(),
+            )
+            if device_info:
+                await store.async_save(device_info)
+    except Exception:
+        # A ConfigEntryNotReady retry cycle must not leak the worker
+        # thread or the persistent device handles the API holds open
+        await _run_in_device_thread(api.close)
+        executor.shutdown(wait=False)
+        raise
+
+    _LOGGER.info(
+        "📊 Setup complete! Data available: %d items",
+        len(coordinator.data["values"]) if coordinator.data else 0,
+    )
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "api": api,
+        "device_info": device_info,
+        "executor": executor,
     }
 
     # Setup platforms
@@ -140,7 +230,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("🔌 Unloading MPP Solar integration")
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Close the persistent device connection on its own thread, then
+        # let the worker wind down
+        executor = entry_data["executor"]
+        await hass.loop.run_in_executor(executor, entry_data["api"].close)
+        executor.shutdown(wait=False)
         _LOGGER.info("✅ MPP Solar integration unloaded successfully")
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's stored device info when the entry is removed."""
+    await Store(hass, 1, f"{DOMAIN}_device_info_{entry.entry_id}").async_remove()
@@ -14,74 +14,129 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import BINARY_SENSOR_MAPPING, DOMAIN, WARNING_MAPPING
 
 _LOGGER = logging.getLogger(__name__)
 
+# Known warning/fault keys resolve to a PROBLEM device class without any
+# token scanning; the rules table below only handles unknown keys
+_KNOWN_PROBLEM_KEYS = frozenset(WARNING_MAPPING)
+
+# Strings treated as "on" for string-valued keys
+_TRUTHY = frozenset({"on", "enabled", "true", "1"})
+
+# Keyword groups matched against the underscore-separated key tokens
+_PROBLEM_TOKENS = frozenset({"fault", "warning", "alarm"})
+_RUNNING_TOKENS = frozenset({"charging", "load", "switched"})
+
+# Device class selection table, checked in order against the key tokens
+_DEVICE_CLASS_RULES = (
+    (_PROBLEM_TOKENS, BinarySensorDeviceClass.PROBLEM),
+    (_RUNNING_TOKENS, BinarySensorDeviceClass.RUNNING),
+    (frozenset({"buzzer"}), BinarySensorDeviceClass.SOUND),
+)
+
+# Icon selection rules, checked in order against the key tokens
+_ICON_RULES = (
+    (_PROBLEM_TOKENS, "mdi:alert-circle"),
+    (frozenset({"charging"}), "mdi:battery-charging"),
+    (frozenset({"load"}), "mdi:power-plug"),
+)
+_DEFAULT_ICON = "mdi:checkbox-marked-circle"
+
+
+def _icon_for_tokens(tokens: frozenset[str]) -> str:
+    """Pick an icon for a sensor key (computed once at setup)."""
+    for rule_tokens, icon in _ICON_RULES:
+        if tokens & rule_tokens:
+            return icon
+    return _DEFAULT_ICON
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary sensor platform."""
-    _LOGGER.info("🏗️ Setting up MPP Solar binary sensors")
+    _LOGGER.debug("🏗️ Setting up MPP Solar binary sensors")
     
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    api = hass.data[DOMAIN][config_entry.entry_id]["api"]
-    
-    # Get device info
-    try:
-        device_info = await hass.async_add_executor_job(api.get_device_info)
-    except Exception as e:
-        _LOGGER.warning("⚠️ Could not get device info: %s", e)
-        device_info = {"serial_number": "unknown", "firmware_version": "Unknown"}
-    
-    entities = []
-    
-    # Create binary sensors for all boolean data
-    if coordinator.data:
-        for key, value_info in coordinator.data.items():
-            # Handle different data formats
-            unit = None
-            value = None
-            
-            if isinstance(value_info, tuple) and len(value_info) >= 2:
-                value, unit = value_info[0], value_info[1]
-            elif isinstance(value_info, bool):
-                value = value_info
-                unit = "bool"
-            
-            # Only create binary sensors for boolean values
-            if unit == "bool" or isinstance(value, bool):
-                # Get friendly name
-                friendly_name = key.replace("_", " ").title()
-                
-                # Determine device class
-                device_class = None
-                if any(word in key.lower() for word in ["fault", "warning", "alarm"]):
-                    device_class = BinarySensorDeviceClass.PROBLEM
-                elif any(word in key.lower() for word in ["charging", "load", "switched"]):
-                    device_class = BinarySensorDeviceClass.RUNNING
-                
-                entities.append(
-                    MPPSolarBinarySensor(
-                        coordinator=coordinator,
-                        key=key,
-                        name=friendly_name,
-                        device_info=device_info,
-                        device_class=device_class,
-                    )
-                )
-    
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.info("🎉 Successfully added %d binary sensor entities", len(entities))
-    else:
-        _LOGGER.info("📭 No binary sensors created (no boolean data found)")
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    # Device info was fetched once during setup - no extra serial round-trip
+    device_info = entry_data["device_info"]
+
+    # One shared registry dict for every entity instead of a copy per entity
+    shared_device_info = {
+        "identifiers": {(DOMAIN, device_info.get("serial_number", "unknown"))},
+        "name": "MPP Solar Inverter",
+        "manufacturer": "MPP Solar",
+        "model": "PIP5048MG",
+        "sw_version": device_info.get("firmware_version", "Unknown"),
+    }
+
+    # Nothing to do until the coordinator has data
+    if not coordinator.data or not coordinator.data["values"]:
+        _LOGGER.debug("📭 No coordinator data yet, no binary sensors created")
+        return
+
+    # Stream entities into HA as they are built instead of collecting a list
+    async_add_entities(_iter_entities(coordinator, shared_device_info))
+
+
+def _iter_entities(coordinator, shared_device_info):
+    """Yield a binary sensor for every boolean key in the coordinator data."""
+    values = coordinator.data["values"]
+    units = coordinator.data["units"]
+    for key, value in values.items():
+        # Only create binary sensors for boolean values
+        if units.get(key) != "bool" and not isinstance(value, bool):
+            continue
+
+        # Get friendly name, preferring the curated mapping from const.py
+        friendly_name = (
+            BINARY_SENSOR_MAPPING.get(key)
+            or WARNING_MAPPING.get(key)
+            or key.replace("_", " ").title()
+        )
+
+        # Classify the key once at setup; is_on only does a lookup
+        tokens = frozenset(key.casefold().split("_"))
+        if isinstance(value, bool):
+            kind = "bool"
+        elif isinstance(value, str):
+            kind = "str"
+        else:
+            kind = "int"
+
+        # Known warning keys short-circuit to PROBLEM; otherwise consult
+        # the rules table
+        if key in _KNOWN_PROBLEM_KEYS:
+            device_class = BinarySensorDeviceClass.PROBLEM
+        else:
+            device_class = next(
+                (cls for rule_tokens, cls in _DEVICE_CLASS_RULES if tokens & rule_tokens),
+                None,
+            )
+
+        yield MPPSolarBinarySensor(
+            coordinator=coordinator,
+            key=key,
+            name=friendly_name,
+            device_info=shared_device_info,
+            device_class=device_class,
+            kind=kind,
+            icon=_icon_for_tokens(tokens),
+        )
 
 class MPPSolarBinarySensor(CoordinatorEntity, BinarySensorEntity):
     """Representation of an MPP Solar binary sensor."""
 
+    # The HA base entities still provide __dict__, but slotting our own
+    # attributes keeps them out of it for large entity counts
+    __slots__ = ("_key", "_kind")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -89,64 +144,50 @@ class MPPSolarBinarySensor(CoordinatorEntity, BinarySensorEntity):
         name: str,
         device_info: dict,
         device_class: BinarySensorDeviceClass | None = None,
+        kind: str = "bool",
+        icon: str = _DEFAULT_ICON,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._key = key
-        self._attr_name = f"MPP Solar {name}"
-        self._attr_unique_id = f"mpp_solar_{key}"
-        
-        # Set device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info.get("serial_number", "unknown"))},
-            "name": "MPP Solar Inverter",
-            "manufacturer": "MPP Solar",
-            "model": "PIP5048MG",
-            "sw_version": device_info.get("firmware_version", "Unknown"),
-        }
-        
+        self._kind = kind
+        self._attr_name = "MPP Solar " + name
+        self._attr_unique_id = "mpp_solar_" + key
+
+        # Shared device info dict built once in async_setup_entry; HA treats
+        # it as read-only so one reference serves every entity
+        self._attr_device_info = device_info
+
         # Set device class
         if device_class:
             self._attr_device_class = device_class
-        
-        # Set icon based on sensor type
-        self._attr_icon = self._get_icon(key)
-
-    def _get_icon(self, key: str) -> str:
-        """Get icon based on sensor key."""
-        key_lower = key.lower()
-        
-        if any(word in key_lower for word in ["fault", "warning", "alarm"]):
-            return "mdi:alert-circle"
-        elif "charging" in key_lower:
-            return "mdi:battery-charging"
-        elif "load" in key_lower:
-            return "mdi:power-plug"
-        else:
-            return "mdi:checkbox-marked-circle"
+
+        # Icon was classified once at setup
+        self._attr_icon = icon
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data or self._key not in self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-            
-        value_info = self.coordinator.data[self._key]
-        
-        if isinstance(value_info, tuple) and len(value_info) >= 1:
-            value = value_info[0]
-        else:
-            value = value_info
-            
-        if isinstance(value, bool):
+
+        value = data["values"].get(self._key)
+        if value is None:
+            return None
+
+        if self._kind == "bool":
             return value
-        elif isinstance(value, str):
-            return value.lower() in ["on", "enabled", "true", "1"]
-        elif isinstance(value, int):
-            return bool(value)
-        return None
+        if self._kind == "str":
+            return value.casefold() in _TRUTHY
+        return bool(value)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        data = self.coordinator.data
+        return (
+            self.coordinator.last_update_success
+            and data is not None
+            and self._key in data["values"]
+        )
@@ -1,10 +1,12 @@
 """Config flow for MPP Solar integration."""
 from __future__ import annotations
 
+import asyncio
+import errno
 import logging
 import os
+import time
 from typing import Any
-import glob
 
 import voluptuous as vol
 
@@ -18,83 +20,146 @@ from .mpp_solar_api import MPPSolarAPI
 
 _LOGGER = logging.getLogger(__name__)
 
-def find_available_devices():
-    """Find available serial/HID devices."""
+# Protocol choices are fixed; build the validator once instead of a fresh
+# vol.In per form render
+_PROTOCOLS = ("PI30", "PI16", "PI17", "PI18")
+_PROTOCOL_VALIDATOR = vol.In(_PROTOCOLS)
+
+# Device scan results are stable over seconds; a short TTL cache makes
+# re-rendering the form after a validation error instant
+_DEVICE_CACHE_TTL = 5.0
+_device_cache: tuple[float, list[str]] | None = None
+
+
+def _scan_dev() -> list[str]:
+    """Scan /dev for hidraw and USB serial devices (blocking)."""
+    # Single pass - scandir entries exist by definition, so no per-match
+    # stat is needed
     devices = []
-    
-    # Check for hidraw devices
-    for device in glob.glob("/dev/hidraw*"):
-        if os.path.exists(device):
-            devices.append(device)
-    
-    # Check for USB serial devices
-    for device in glob.glob("/dev/ttyUSB*"):
-        if os.path.exists(device):
-            devices.append(device)
-    
-    # Check for serial by-id devices
-    for device in glob.glob("/dev/serial/by-id/*"):
-        if os.path.exists(device):
-            devices.append(device)
-    
-    # Add socket option for ser2net
+    try:
+        with os.scandir("/dev") as entries:
+            for entry in entries:
+                if entry.name.startswith(("hidraw", "ttyUSB")):
+                    devices.append(entry.path)
+    except OSError:
+        pass
+    return devices
+
+
+def _scan_by_id() -> list[str]:
+    """Scan /dev/serial/by-id aliases (blocking).
+
+    The directory only exists when devices are present, and on some
+    systems stat-ing it is the slow part - hence a separate job.
+    """
+    try:
+        with os.scandir("/dev/serial/by-id") as entries:
+            return [entry.path for entry in entries]
+    except OSError:
+        return []
+
+
+def _assemble_device_list(*scans: list[str]) -> list[str]:
+    """Combine scan results with the fixed socket/manual choices."""
+    devices = sorted(device for scan in scans for device in scan)
+    # Socket option for ser2net, plus the manual entry escape hatch
     devices.append("socket://localhost:2001")
-    
-    # Add manual entry option
     devices.append("manual")
-    
     return devices
 
+
+def find_available_devices():
+    """Find available serial/HID devices."""
+    global _device_cache
+
+    if _device_cache and time.monotonic() - _device_cache[0] < _DEVICE_CACHE_TTL:
+        return _device_cache[1]
+
+    devices = _assemble_device_list(_scan_dev(), _scan_by_id())
+    _device_cache = (time.monotonic(), devices)
+    return devices
+
+
+async def _async_find_available_devices(hass: HomeAssistant) -> list[str]:
+    """Run the independent directory scans concurrently.
+
+    Latency of the form render becomes max(scan times) instead of their
+    sum when one of the directories is slow to stat.
+    """
+    global _device_cache
+
+    if _device_cache and time.monotonic() - _device_cache[0] < _DEVICE_CACHE_TTL:
+        return _device_cache[1]
+
+    scans = await asyncio.gather(
+        hass.async_add_executor_job(_scan_dev),
+        hass.async_add_executor_job(_scan_by_id),
+    )
+    devices = _assemble_device_list(*scans)
+    _device_cache = (time.monotonic(), devices)
+    return devices
+
+def _probe_device_path(device_path: str) -> str:
+    """Resolve a device path with one open() attempt per candidate.
+
+    A successful open proves both existence and readability in a single
+    syscall; the old exists/access chain needed several and was racy.
+    """
+    candidates = [device_path]
+    if not device_path.startswith("/"):
+        candidates.append(f"/dev/{device_path}")
+        candidates.append(f"/dev/serial/by-id/{device_path}")
+
+    for candidate in candidates:
+        try:
+            fd = os.open(candidate, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as err:
+            if err.errno == errno.EACCES:
+                # The connection test can still fix permissions - warn and
+                # carry on with this path
+                _LOGGER.warning(
+                    "Cannot read from %s. Will try anyway (might need permissions)",
+                    candidate,
+                )
+                return candidate
+            continue
+        os.close(fd)
+        return candidate
+
+    raise CannotConnect(
+        f"Device path {device_path} does not exist. "
+        f"Available devices: {', '.join(find_available_devices())}"
+    )
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
-    
+
     device_path = data["device_path"]
     protocol = data["protocol"]
-    
-    # Skip file existence check for socket connections
+
+    # Skip the device probe for socket connections
     if not device_path.startswith("socket://"):
-        # Check if device path exists
-        if not os.path.exists(device_path):
-            # Try common alternatives
-            alternatives = [
-                device_path,
-                f"/dev/{device_path}" if not device_path.startswith("/") else device_path,
-                f"/dev/serial/by-id/{device_path}" if not device_path.startswith("/") else device_path,
-            ]
-            
-            found = False
-            for alt in alternatives:
-                if os.path.exists(alt):
-                    device_path = alt
-                    data["device_path"] = alt
-                    found = True
-                    break
-            
-            if not found:
-                raise CannotConnect(f"Device path {device_path} does not exist. Available devices: {', '.join(find_available_devices())}")
-        
-        # Check if we can read from device
-        if not os.access(device_path, os.R_OK):
-            _LOGGER.warning(f"Cannot read from {device_path}. Will try anyway (might need permissions)")
-    
-    # Test connection to the device
+        device_path = await hass.async_add_executor_job(_probe_device_path, device_path)
+        data["device_path"] = device_path
+
+    # Test connection and read device info in a single executor job
     api = MPPSolarAPI(device_path, protocol)
     try:
-        if await hass.async_add_executor_job(api.test_connection):
-            _LOGGER.info(f"Successfully connected to {device_path}")
+        connected, device_info = await hass.async_add_executor_job(api.validate_and_fetch)
+        if connected:
+            _LOGGER.info("Successfully connected to %s", device_path)
         else:
-            _LOGGER.warning(f"Connection test returned False for {device_path}")
-    except Exception as err:
-        _LOGGER.error("Failed to connect to MPP Solar device: %s", err)
-        # Don't fail immediately, sometimes first connection fails
-        _LOGGER.info("Will retry connection during setup")
-
-    # Get device info for unique ID
-    try:
-        device_info = await hass.async_add_executor_job(api.get_device_info)
-        serial_number = device_info.get("serial_number", "unknown")
+            # Don't fail immediately, sometimes first connection fails -
+            # setup will retry
+            _LOGGER.warning("Connection test failed for %s, will retry during setup", device_path)
+        serial_number = device_info.get("serial_number") or device_path.replace("/", "_").replace(":", "_")
     except Exception:
         serial_number = device_path.replace("/", "_").replace(":", "_")
+    finally:
+        # The API keeps the device handle open for reuse; this throwaway
+        # instance must release it so setup can open the port itself
+        await hass.async_add_executor_job(api.close)
 
     return {
         "title": data["name"],
@@ -135,13 +200,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
-        # Get available devices
-        devices = await self.hass.async_add_executor_job(find_available_devices)
+        # Get available devices (scans run concurrently)
+        devices = await _async_find_available_devices(self.hass)
         
         device_schema = vol.Schema(
             {
                 vol.Required("device_selection", default=devices[0] if devices else "manual"): vol.In(devices),
-                vol.Optional("protocol", default=DEFAULT_PROTOCOL): vol.In(["PI30", "PI16", "PI17", "PI18"]),
+                vol.Optional("protocol", default=DEFAULT_PROTOCOL): _PROTOCOL_VALIDATOR,
                 vol.Optional("name", default="MPP Solar Inverter"): str,
             }
         )
@@ -174,7 +239,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         manual_schema = vol.Schema(
             {
                 vol.Required("device_path", default="/dev/hidraw2"): str,
-                vol.Optional("protocol", default=DEFAULT_PROTOCOL): vol.In(["PI30", "PI16", "PI17", "PI18"]),
+                vol.Optional("protocol", default=DEFAULT_PROTOCOL): _PROTOCOL_VALIDATOR,
                 vol.Optional("name", default="MPP Solar Inverter"): str,
             }
         )
@@ -1,4 +1,5 @@
 """Constants for the MPP Solar integration."""
+from types import MappingProxyType
 
 DOMAIN = "mpp_solar"
 
@@ -7,7 +8,7 @@ DEFAULT_PROTOCOL = "PI30"
 DEFAULT_UPDATE_INTERVAL = 30
 
 # Commands to monitor
-COMMANDS_TO_MONITOR = [
+COMMANDS_TO_MONITOR = (
     "QPIGS",  # General status
     "QPIRI",  # Device rating information
     "QPIWS",  # Device warning status
@@ -15,30 +16,21 @@ COMMANDS_TO_MONITOR = [
     "QMOD",   # Device mode
     "QID",    # Device serial number
     "QVFW",   # Main CPU firmware version
-]
+)
 
-# Device classes for sensors
-DEVICE_CLASSES = {
-    "W": "power",
-    "V": "voltage", 
-    "A": "current",
-    "°C": "temperature",
-    "Hz": "frequency",
-    "%": None,  # Will be determined by sensor name
-}
-
-# State classes for sensors
-STATE_CLASSES = {
-    "W": "measurement",
-    "V": "measurement",
-    "A": "measurement", 
-    "°C": "measurement",
-    "Hz": "measurement",
-    "%": "measurement",
-}
+# Fused (device_class, state_class, icon) attributes per unit - one lookup
+# per sensor instead of three separate dict hits
+SENSOR_ATTRS = MappingProxyType({
+    "W": ("power", "measurement", "mdi:flash"),
+    "V": ("voltage", "measurement", "mdi:lightning-bolt"),
+    "A": ("current", "measurement", "mdi:current-ac"),
+    "°C": ("temperature", "measurement", "mdi:thermometer"),
+    "Hz": ("frequency", "measurement", "mdi:sine-wave"),
+    "%": (None, "measurement", None),  # Device class determined by sensor name
+})
 
 # Icons for different sensor types
-SENSOR_ICONS = {
+SENSOR_ICONS = MappingProxyType({
     "power": "mdi:flash",
     "voltage": "mdi:lightning-bolt",
     "current": "mdi:current-ac",
@@ -48,10 +40,10 @@ SENSOR_ICONS = {
     "solar": "mdi:solar-panel",
     "inverter": "mdi:power-plug",
     "load": "mdi:chart-line",
-}
+})
 
 # Binary sensor mappings
-BINARY_SENSOR_MAPPING = {
+BINARY_SENSOR_MAPPING = MappingProxyType({
     "is_load_on": "Load Status",
     "is_charging_on": "Charging Status", 
     "is_scc_charging_on": "SCC Charging Status",
@@ -68,10 +60,10 @@ BINARY_SENSOR_MAPPING = {
     "overload_bypass": "Overload Bypass",
     "power_saving": "Power Saving",
     "lcd_reset_to_default": "LCD Reset Default",
-}
+})
 
 # Warning/fault status mappings
-WARNING_MAPPING = {
+WARNING_MAPPING = MappingProxyType({
     "inverter_fault": "Inverter Fault",
     "bus_over_fault": "Bus Over Fault",
     "bus_under_fault": "Bus Under Fault", 
@@ -99,4 +91,4 @@ WARNING_MAPPING = {
     "mppt_overload_fault": "MPPT Overload Fault",
     "mppt_overload_warning": "MPPT Overload Warning",
     "battery_too_low_to_charge_warning": "Battery Too Low to Charge",
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import logging
+import select
+import stat
 import struct
+import threading
 import time
+from functools import lru_cache
 from typing import Any
 import os
 
@@ -23,15 +27,209 @@ COMMANDS = {
 }
 
 
+def _crc_reduce(byte: int) -> int:
+    """Run the 8-step CRC bit loop for one input byte (table seeding)."""
+    crc = byte
+    for _ in range(8):
+        if crc & 1:
+            crc = (crc >> 1) ^ 0xA001
+        else:
+            crc = crc >> 1
+    return crc
+
+
+# 256-entry lookup table for the 0xA001 (reflected) polynomial - reduces
+# the per-byte cost from an 8-iteration bit loop to one lookup and XOR
+_CRC_TABLE = tuple(_crc_reduce(i) for i in range(256))
+
+
+try:
+    # Optional C-compiled CRC. 'crc-16' is the ARC variant - polynomial
+    # 0x8005 reflected (0xA001), initial value 0 - which matches the PI30
+    # bit loop exactly ('modbus' does not: it starts at 0xFFFF).
+    from crcmod.predefined import mkPredefinedCrcFun
+
+    _crc16 = mkPredefinedCrcFun('crc-16')
+
+    @lru_cache(maxsize=32)
+    def _crc_bytes(command: str) -> bytes:
+        """Compute the PI30 protocol CRC16 for a command string."""
+        return struct.pack('<H', _crc16(command.encode()))
+
+except ImportError:
+
+    @lru_cache(maxsize=32)
+    def _crc_bytes(command: str) -> bytes:
+        """Compute the PI30 protocol CRC16 for a command string."""
+        crc = 0
+        for b in command.encode():
+            crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ b) & 0xFF]
+        return struct.pack('<H', crc)
+
+
+# Ports already warned about a latency timer stuck above 1 ms
+_LATENCY_WARNED: set[str] = set()
+
+
+def _set_low_latency(ser: serial.Serial) -> None:
+    """Enable the kernel low-latency mode on a USB serial port.
+
+    FTDI adapters (the common MPP Solar cable) buffer reads behind a
+    16 ms latency timer by default; ASYNC_LOW_LATENCY drops it to 1 ms.
+    Devices that don't back the serial ioctls are silently left alone.
+    """
+    try:
+        # pyserial handles the TIOCGSERIAL/TIOCSSERIAL dance
+        ser.set_low_latency_mode(True)
+    except (ValueError, OSError, AttributeError):
+        pass
+
+    # The timer is also exposed through sysfs on usb-serial adapters;
+    # write it directly as a fallback for drivers that ignore the ioctl
+    port = ser.port or ""
+    sysfs = "/sys/bus/usb-serial/devices/%s/latency_timer" % os.path.basename(port)
+    try:
+        with open(sysfs, "w") as timer_file:
+            timer_file.write("1")
+    except OSError:
+        pass
+
+    # Warn once per port if the timer is still high - each response then
+    # pays the extra delay several times over
+    try:
+        with open(sysfs) as timer_file:
+            timer = int(timer_file.read().strip())
+    except (OSError, ValueError):
+        return
+    if timer > 1 and port not in _LATENCY_WARNED:
+        _LATENCY_WARNED.add(port)
+        _LOGGER.warning(
+            "USB serial latency_timer for %s is %d ms; lowering it to 1 ms "
+            "would reduce response latency",
+            port,
+            timer,
+        )
+
+
+# How long a QMOD (device mode) reading may be served from cache
+_MODE_CACHE_TTL = 60.0
+
+# QPIGS numeric fields, in wire order: (key, cast, unit)
+_QPIGS_SCHEMA = (
+    ("ac_input_voltage", float, "V"),
+    ("ac_input_frequency", float, "Hz"),
+    ("ac_output_voltage", float, "V"),
+    ("ac_output_frequency", float, "Hz"),
+    ("ac_output_apparent_power", int, "VA"),
+    ("ac_output_active_power", int, "W"),
+    ("ac_output_load", int, "%"),
+    ("bus_voltage", int, "V"),
+    ("battery_voltage", float, "V"),
+    ("battery_charging_current", int, "A"),
+    ("battery_capacity", int, "%"),
+    ("inverter_heat_sink_temperature", int, "°C"),
+    ("pv_input_current_for_battery", float, "A"),
+    ("pv_input_voltage", float, "V"),
+    ("battery_voltage_from_scc", float, "V"),
+    ("battery_discharge_current", int, "A"),
+)
+_QPIGS_UNITS = {name: unit for name, _, unit in _QPIGS_SCHEMA}
+
+# QPIGS trailing device-status flag digits, in wire order
+_QPIGS_FLAG_NAMES = (
+    "is_sbu_priority_version_added",
+    "is_configuration_changed",
+    "is_scc_firmware_updated",
+    "is_load_on",
+    "is_battery_voltage_to_steady_while_charging",
+    "is_charging_on",
+    "is_scc_charging_on",
+    "is_ac_charging_on",
+)
+
+# QPIWS warning bits, in wire order; position 12 is reserved
+_QPIWS_NAMES = (
+    "inverter_fault",
+    "bus_over_fault",
+    "bus_under_fault",
+    "bus_soft_fail_fault",
+    "line_fail_warning",
+    "opv_short_warning",
+    "inverter_voltage_too_low_fault",
+    "inverter_voltage_too_high_fault",
+    "over_temperature_fault",
+    "fan_locked_fault",
+    "battery_voltage_too_high_fault",
+    "battery_low_alarm_warning",
+    None,
+    "battery_under_shutdown_warning",
+    "overload_fault",
+    "eeprom_fault",
+    "inverter_over_current_fault",
+    "inverter_soft_fail_fault",
+    "self_test_fail_fault",
+    "op_dc_voltage_over_fault",
+    "battery_open_fault",
+    "current_sensor_fail_fault",
+    "battery_short_fault",
+    "power_limit_warning",
+    "pv_voltage_high_warning",
+    "mppt_overload_fault",
+    "mppt_overload_warning",
+    "battery_too_low_to_charge_warning",
+)
+
+def _serial_frame(command: str) -> bytes:
+    """Build the wire frame for a command: payload + CRC16 + '\\r'."""
+    return command.encode() + _crc_bytes(command) + b'\r'
+
+
+def _hid_frame(command: str) -> bytes:
+    """Build the hidraw frame: wire frame padded to the 8-byte minimum."""
+    frame = _serial_frame(command)
+    if len(frame) < 8:
+        frame = frame.ljust(8, b'\x00')
+    return frame
+
+
+# The monitored command set is tiny and fixed, so prebuild the complete
+# immutable wire frames (payload + CRC + terminator, hidraw-padded where
+# needed) at import - the steady-state send path is one dict lookup and
+# a write
+_SERIAL_FRAMES = {cmd: _serial_frame(cmd) for cmd in COMMANDS}
+_HID_FRAMES = {cmd: _hid_frame(cmd) for cmd in COMMANDS}
+
+
 class MPPSolarAPI:
     """API for communicating with MPP Solar devices."""
 
+    __slots__ = (
+        "device_path",
+        "protocol",
+        "_device",
+        "_connection_type",
+        "_serial",
+        "_hid_fd",
+        "_lock",
+        "_permission_fixed",
+        "_mode_cache",
+        "_serial_number_cache",
+        "_firmware_cache",
+    )
+
     def __init__(self, device_path: str, protocol: str = "PI30"):
         """Initialize the API."""
         self.device_path = device_path
         self.protocol = protocol
         self._device = None
         self._connection_type = self._detect_connection_type(device_path)
+        self._serial: serial.Serial | None = None
+        self._hid_fd: int | None = None
+        self._lock = threading.Lock()
+        self._permission_fixed = False
+        self._mode_cache: tuple[str, float] | None = None
+        self._serial_number_cache: str | None = None
+        self._firmware_cache: str | None = None
 
     def _detect_connection_type(self, device_path: str) -> str:
         """Detect connection type from device path."""
@@ -42,34 +240,25 @@ class MPPSolarAPI:
         elif "ttyUSB" in device_path or "serial" in device_path:
             return "serial"
         else:
-            # Try to detect based on actual device
-            if os.path.exists(device_path):
-                # Check if it's a hidraw device
-                try:
-                    with open(device_path, 'rb') as f:
-                        return "hidraw"
-                except:
-                    return "serial"
+            # Probe with a stat instead of opening the node - opening a
+            # hidraw device can take 50-200 ms, may reset the HID
+            # endpoint, and races with other readers. The hidraw/ttyUSB
+            # name heuristics above already classified known paths, so a
+            # remaining character device is treated as serial.
+            try:
+                st = os.stat(device_path)
+            except OSError:
+                return "unknown"
+            if stat.S_ISCHR(st.st_mode):
+                return "serial"
             return "unknown"
 
-    def _calculate_crc(self, command: str) -> bytes:
-        """Calculate CRC for PI30 protocol."""
-        crc = 0
-        for char in command:
-            crc = crc ^ ord(char)
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc = crc >> 1
-        return struct.pack('<H', crc)
-
     def _send_command(self, command: str) -> str:
         """Send command to device and return response."""
         if self._connection_type == "hidraw":
-            return self._send_hidraw_command(command)
+            send = self._send_hidraw_command
         elif self._connection_type == "serial":
-            return self._send_serial_command(command)
+            send = self._send_serial_command
         else:
             # Try both methods
             try:
@@ -77,57 +266,102 @@ class MPPSolarAPI:
             except:
                 return self._send_serial_command(command)
 
+        try:
+            return send(command)
+        except OSError:
+            # The failed send already dropped its handle, so this retry
+            # runs on a freshly opened port - a stale fd after a USB
+            # re-enumeration self-heals without failing the whole poll
+            return send(command)
+
+    def _ensure_hid_fd(self) -> int:
+        """Open the hidraw node once and reuse the fd.
+
+        Non-blocking mode pairs with select() below so reads wake on the
+        first available byte instead of sleeping in fixed steps. Callers
+        must hold _lock.
+        """
+        if self._hid_fd is None:
+            self._hid_fd = os.open(self.device_path, os.O_RDWR | os.O_NONBLOCK)
+        return self._hid_fd
+
+    def _drop_hid_fd(self) -> None:
+        """Close and forget the hidraw fd. Callers must hold _lock."""
+        if self._hid_fd is not None:
+            try:
+                os.close(self._hid_fd)
+            except OSError:
+                pass
+            self._hid_fd = None
+
     def _send_hidraw_command(self, command: str) -> str:
         """Send command via hidraw interface (for Raspberry Pi)."""
-        try:
-            # For Raspberry Pi, we need to handle hidraw differently
-            with open(self.device_path, 'r+b', buffering=0) as device:
-                # Prepare command
-                crc = self._calculate_crc(command)
-                full_command = command.encode() + crc + b'\r'
-                
-                # For hidraw on RPi, we may need to pad the command
-                if len(full_command) < 8:
-                    full_command = full_command.ljust(8, b'\x00')
-                
+        with self._lock:
+            try:
+                fd = self._ensure_hid_fd()
+
+                # Prebuilt frame for known commands; build ad-hoc otherwise
+                full_command = _HID_FRAMES.get(command)
+                if full_command is None:
+                    full_command = _hid_frame(command)
+
                 # Send command
-                device.write(full_command)
-                device.flush()
-                
-                # Give device time to respond
-                time.sleep(0.2)
-                
-                # Read response (may need multiple reads on RPi)
-                response = b''
-                max_attempts = 10
-                while max_attempts > 0:
-                    chunk = device.read(512)
+                os.write(fd, full_command)
+
+                # Wake when the kernel has bytes ready instead of
+                # polling with 100 ms sleeps; the deadline bounds the
+                # whole exchange
+                # bytearray appends are amortized O(1); bytes += would
+                # reallocate and copy the accumulated buffer per chunk
+                response = bytearray()
+                deadline = time.monotonic() + 2.0
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    ready, _, _ = select.select([fd], [], [], remaining)
+                    if not ready:
+                        break
+                    chunk = os.read(fd, 512)
                     if chunk:
-                        response += chunk
+                        response.extend(chunk)
                         if b'\r' in response:
                             break
-                    else:
-                        time.sleep(0.1)
-                    max_attempts -= 1
-                
+
+                if b'\r' not in response:
+                    # Timed out mid-reply. A late answer would stay queued
+                    # on the persistent fd and be read as the *next*
+                    # command's response; reopening the node gets a fresh
+                    # report queue (the hidraw analogue of the serial
+                    # path's reset_input_buffer)
+                    self._drop_hid_fd()
+
                 if response and response.startswith(b'('):
                     # Remove leading '(' and trailing CRC + '\r'
                     end_idx = response.find(b'\r')
                     if end_idx > 0:
                         data = response[1:end_idx-2].decode('utf-8', errors='ignore')
                         return data
-                
+
                 return ""
-                
-        except Exception as e:
-            _LOGGER.error("HID communication failed: %s", e)
-            raise
 
-    def _send_serial_command(self, command: str) -> str:
-        """Send command via serial interface."""
-        try:
+            except Exception as e:
+                _LOGGER.error("HID communication failed: %s", e)
+                # Invalidate the fd so the next command reopens the node
+                self._drop_hid_fd()
+                raise
+
+    def _ensure_serial(self) -> serial.Serial:
+        """Open the serial port once and reuse it for later commands.
+
+        Re-opening per command pays driver setup, DTR toggling and
+        parameter writes (often 50-200 ms on USB-serial) for each of the
+        seven commands in a full poll; a persistent handle puts the same
+        bytes on the wire with none of that. Callers must hold _lock.
+        """
+        if self._serial is None or not self._serial.is_open:
             # Serial parameters for MPP Solar
-            with serial.Serial(
+            self._serial = serial.Serial(
                 port=self.device_path,
                 baudrate=2400,
                 bytesize=serial.EIGHTBITS,
@@ -135,41 +369,161 @@ class MPPSolarAPI:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=2,
                 write_timeout=2
-            ) as ser:
-                # Clear buffers
+            )
+            _set_low_latency(self._serial)
+        return self._serial
+
+    def _drop_serial(self) -> None:
+        """Close and forget the port so the next command reopens it.
+
+        Callers must hold _lock.
+        """
+        if self._serial is not None:
+            try:
+                self._serial.close()
+            except Exception:
+                pass
+            self._serial = None
+
+    def close(self) -> None:
+        """Release the device connection (called when unloading)."""
+        with self._lock:
+            self._drop_serial()
+            self._drop_hid_fd()
+
+    def _send_serial_command(self, command: str) -> str:
+        """Send command via serial interface."""
+        with self._lock:
+            try:
+                ser = self._ensure_serial()
+
+                # Clear any stale bytes left over from a timed-out command
                 ser.reset_input_buffer()
                 ser.reset_output_buffer()
-                
-                # Send command
-                crc = self._calculate_crc(command)
-                full_command = command.encode() + crc + b'\r'
-                
+
+                # Prebuilt frame for known commands; build ad-hoc otherwise
+                full_command = _SERIAL_FRAMES.get(command)
+                if full_command is None:
+                    full_command = _serial_frame(command)
+
                 ser.write(full_command)
                 ser.flush()
-                
-                # Read response
-                response = b''
-                start_time = time.time()
-                while time.time() - start_time < 2:
-                    if ser.in_waiting:
-                        chunk = ser.read(ser.in_waiting)
-                        response += chunk
-                        if b'\r' in response:
-                            break
-                    else:
-                        time.sleep(0.05)
-                
+
+                # Read response - read_until blocks in the kernel and
+                # returns as soon as the '\r' terminator arrives (or the
+                # 2 s port timeout expires), instead of polling in_waiting
+                # every 50 ms
+                response = ser.read_until(b'\r', 512)
+
                 if response and response.startswith(b'('):
                     end_idx = response.find(b'\r')
                     if end_idx > 0:
                         data = response[1:end_idx-2].decode('utf-8', errors='ignore')
                         return data
-                
+
                 return ""
-                
+
+            except Exception as e:
+                _LOGGER.error("Serial communication failed: %s", e)
+                # Invalidate the handle so the next command reopens a
+                # fresh port - preserves the old open-per-call resilience
+                self._drop_serial()
+                raise
+
+    def _exchange_batch(self, commands: list[str]) -> list[str] | None:
+        """Write all frames back-to-back, then collect all replies.
+
+        The inverter answers strictly in order on its half-duplex link,
+        so the frames can be queued in one burst and the concatenated
+        replies split on their terminators afterwards - N round-trips
+        collapse into one write and one read pass. Returns None when
+        fewer replies than commands arrived.
+        """
+        expected = len(commands)
+        deadline = time.monotonic() + 2.0 * expected
+        response = bytearray()
+
+        with self._lock:
+            if self._connection_type == "hidraw":
+                try:
+                    fd = self._ensure_hid_fd()
+                    for command in commands:
+                        frame = _HID_FRAMES.get(command)
+                        os.write(fd, frame if frame else _hid_frame(command))
+                    while response.count(b'\r') < expected:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        ready, _, _ = select.select([fd], [], [], remaining)
+                        if not ready:
+                            break
+                        chunk = os.read(fd, 512)
+                        if chunk:
+                            response.extend(chunk)
+                    if response.count(b'\r') < expected:
+                        # Short batch: replies still in flight would be
+                        # misread as answers to the next exchange, so
+                        # start over with a fresh report queue
+                        self._drop_hid_fd()
+                except Exception:
+                    self._drop_hid_fd()
+                    raise
+            elif self._connection_type == "serial":
+                try:
+                    ser = self._ensure_serial()
+                    ser.reset_input_buffer()
+                    ser.reset_output_buffer()
+                    ser.write(b''.join(
+                        _SERIAL_FRAMES.get(command) or _serial_frame(command)
+                        for command in commands
+                    ))
+                    ser.flush()
+                    while (
+                        response.count(b'\r') < expected
+                        and time.monotonic() < deadline
+                    ):
+                        chunk = ser.read_until(b'\r', 512)
+                        if not chunk:
+                            break
+                        response.extend(chunk)
+                except Exception:
+                    self._drop_serial()
+                    raise
+            else:
+                return None
+
+        replies = [
+            part[1:-2].decode('utf-8', errors='ignore')
+            for part in response.split(b'\r')
+            if part.startswith(b'(')
+        ]
+        if len(replies) < expected:
+            return None
+        return replies[:expected]
+
+    def _send_commands_pipelined(self, commands: list[str]) -> list[str]:
+        """Send several commands, pipelined when the device cooperates.
+
+        Falls back to sequential sends (with per-command error
+        isolation, returning "" for failures) when the batched exchange
+        comes back short or errors out.
+        """
+        try:
+            replies = self._exchange_batch(commands)
         except Exception as e:
-            _LOGGER.error("Serial communication failed: %s", e)
-            raise
+            _LOGGER.debug("Pipelined send failed (%s), falling back", e)
+            replies = None
+        if replies is not None:
+            return replies
+
+        results = []
+        for command in commands:
+            try:
+                results.append(self._send_command(command))
+            except Exception as e:
+                _LOGGER.error("Failed to send %s: %s", command, e)
+                results.append("")
+        return results
 
     def test_connection(self) -> bool:
         """Test connection to device."""
@@ -185,160 +539,236 @@ class MPPSolarAPI:
             
         except Exception as e:
             _LOGGER.error("Connection test failed: %s", e)
-            # Try to set permissions if it's a permission error
-            if "Permission denied" in str(e) and os.path.exists(self.device_path):
+            # Try the permission fix at most once per instance - repeated
+            # chmod attempts during HA's retry polling are a privileged
+            # syscall per poll and pure log noise
+            if (
+                not self._permission_fixed
+                and "Permission denied" in str(e)
+                and os.path.exists(self.device_path)
+            ):
+                self._permission_fixed = True
                 try:
                     os.chmod(self.device_path, 0o666)
-                    _LOGGER.info(f"Fixed permissions for {self.device_path}")
+                    _LOGGER.info("Fixed permissions for %s", self.device_path)
                     # Retry
                     response = self._send_command("QID")
                     return bool(response and len(response) > 0)
-                except:
-                    pass
+                except Exception:
+                    _LOGGER.debug("Permission fix for %s failed", self.device_path)
             return False
 
+    def validate_and_fetch(self) -> tuple[bool, dict[str, Any]]:
+        """Test the connection and fetch device info in a single call.
+
+        Bundles both steps so callers pay one executor dispatch instead
+        of two.
+        """
+        try:
+            connected = self.test_connection()
+        except Exception as e:
+            _LOGGER.error("Connection validation failed: %s", e)
+            connected = False
+
+        return connected, self.get_device_info()
+
     def get_device_info(self) -> dict[str, Any]:
         """Get basic device information."""
         info = {}
-        
+
         try:
-            # Get serial number
-            serial_response = self._send_command("QID")
-            if serial_response:
-                info["serial_number"] = serial_response.strip()
-            
-            # Get firmware version
-            fw_response = self._send_command("QVFW")
-            if fw_response:
-                info["firmware_version"] = fw_response.strip()
-            
-            # Get device mode
-            mode_response = self._send_command("QMOD")
-            if mode_response:
-                info["mode"] = mode_response.strip()
-                
+            # Serial number and firmware version never change for a given
+            # device - query them once per instance and reuse
+            if self._serial_number_cache is None:
+                serial_response = self._send_command("QID")
+                if serial_response:
+                    self._serial_number_cache = serial_response.strip()
+            if self._serial_number_cache is not None:
+                info["serial_number"] = self._serial_number_cache
+
+            if self._firmware_cache is None:
+                fw_response = self._send_command("QVFW")
+                if fw_response:
+                    self._firmware_cache = fw_response.strip()
+            if self._firmware_cache is not None:
+                info["firmware_version"] = self._firmware_cache
+
+            # Device mode shares the runtime-data TTL cache
+            if (
+                self._mode_cache is not None
+                and time.monotonic() - self._mode_cache[1] < _MODE_CACHE_TTL
+            ):
+                info["mode"] = self._mode_cache[0]
+            else:
+                mode_response = self._send_command("QMOD")
+                if mode_response:
+                    mode = mode_response.strip()
+                    self._mode_cache = (mode, time.monotonic())
+                    info["mode"] = mode
+
         except Exception as e:
             _LOGGER.error("Failed to get device info: %s", e)
-        
+
         return info
 
-    def _parse_qpigs(self, data: str) -> dict[str, tuple[Any, str]]:
-        """Parse QPIGS command response."""
+    def _parse_qpigs(self, data: str) -> tuple[dict[str, Any], dict[str, str]]:
+        """Parse QPIGS command response into value and unit dicts."""
         if not data:
-            return {}
-            
+            return {}, {}
+
         values = data.split()
         if len(values) < 21:
             _LOGGER.warning("QPIGS response too short: %s", data)
-            return {}
-        
+            return {}, {}
+
+        # Schema-driven conversion: one tight loop over (key, cast, unit)
+        # triples instead of 16 hard-coded conversion lines
         parsed = {
-            "ac_input_voltage": (float(values[0]), "V"),
-            "ac_input_frequency": (float(values[1]), "Hz"),
-            "ac_output_voltage": (float(values[2]), "V"),
-            "ac_output_frequency": (float(values[3]), "Hz"),
-            "ac_output_apparent_power": (int(values[4]), "VA"),
-            "ac_output_active_power": (int(values[5]), "W"),
-            "ac_output_load": (int(values[6]), "%"),
-            "bus_voltage": (int(values[7]), "V"),
-            "battery_voltage": (float(values[8]), "V"),
-            "battery_charging_current": (int(values[9]), "A"),
-            "battery_capacity": (int(values[10]), "%"),
-            "inverter_heat_sink_temperature": (int(values[11]), "°C"),
-            "pv_input_current_for_battery": (float(values[12]), "A"),
-            "pv_input_voltage": (float(values[13]), "V"),
-            "battery_voltage_from_scc": (float(values[14]), "V"),
-            "battery_discharge_current": (int(values[15]), "A"),
+            name: cast(value)
+            for (name, cast, _), value in zip(_QPIGS_SCHEMA, values)
         }
-        
-        # Parse boolean flags (if available)
+        units = dict(_QPIGS_UNITS)
+
+        # Parse boolean flags (if available) - comparing each digit to
+        # '1' skips the int()/bool() object churn per flag
         if len(values) > 16:
-            flags = values[16] if len(values) > 16 else "00000000"
+            flags = values[16]
             if len(flags) >= 8:
-                parsed.update({
-                    "is_sbu_priority_version_added": (bool(int(flags[0])), "bool"),
-                    "is_configuration_changed": (bool(int(flags[1])), "bool"),
-                    "is_scc_firmware_updated": (bool(int(flags[2])), "bool"),
-                    "is_load_on": (bool(int(flags[3])), "bool"),
-                    "is_battery_voltage_to_steady_while_charging": (bool(int(flags[4])), "bool"),
-                    "is_charging_on": (bool(int(flags[5])), "bool"),
-                    "is_scc_charging_on": (bool(int(flags[6])), "bool"),
-                    "is_ac_charging_on": (bool(int(flags[7])), "bool"),
-                })
-        
+                for key, flag in zip(_QPIGS_FLAG_NAMES, flags):
+                    parsed[key] = flag == "1"
+                    units[key] = "bool"
+
         # Calculate additional derived values
         if "pv_input_voltage" in parsed and "pv_input_current_for_battery" in parsed:
-            pv_voltage = parsed["pv_input_voltage"][0]
-            pv_current = parsed["pv_input_current_for_battery"][0]
-            parsed["pv_input_power"] = (int(pv_voltage * pv_current), "W")
-        
-        return parsed
+            pv_voltage = parsed["pv_input_voltage"]
+            pv_current = parsed["pv_input_current_for_battery"]
+            parsed["pv_input_power"] = int(pv_voltage * pv_current)
+            units["pv_input_power"] = "W"
+
+        return parsed, units
 
-    def _parse_qpiws(self, data: str) -> dict[str, tuple[Any, str]]:
+    def _parse_qpiws(self, data: str) -> tuple[dict[str, Any], dict[str, str]]:
         """Parse QPIWS (warning status) command response."""
         if not data or len(data) < 32:
-            return {}
-        
+            return {}, {}
+
+        # One char-compare per bit; None entries mark reserved positions
         warnings = {
-            "inverter_fault": (bool(int(data[0])), "bool"),
-            "bus_over_fault": (bool(int(data[1])), "bool"),
-            "bus_under_fault": (bool(int(data[2])), "bool"),
-            "bus_soft_fail_fault": (bool(int(data[3])), "bool"),
-            "line_fail_warning": (bool(int(data[4])), "bool"),
-            "opv_short_warning": (bool(int(data[5])), "bool"),
-            "inverter_voltage_too_low_fault": (bool(int(data[6])), "bool"),
-            "inverter_voltage_too_high_fault": (bool(int(data[7])), "bool"),
-            "over_temperature_fault": (bool(int(data[8])), "bool"),
-            "fan_locked_fault": (bool(int(data[9])), "bool"),
-            "battery_voltage_too_high_fault": (bool(int(data[10])), "bool"),
-            "battery_low_alarm_warning": (bool(int(data[11])), "bool"),
-            "battery_under_shutdown_warning": (bool(int(data[13])), "bool"),
-            "overload_fault": (bool(int(data[14])), "bool"),
-            "eeprom_fault": (bool(int(data[15])), "bool"),
-            "inverter_over_current_fault": (bool(int(data[16])), "bool"),
-            "inverter_soft_fail_fault": (bool(int(data[17])), "bool"),
-            "self_test_fail_fault": (bool(int(data[18])), "bool"),
-            "op_dc_voltage_over_fault": (bool(int(data[19])), "bool"),
-            "battery_open_fault": (bool(int(data[20])), "bool"),
-            "current_sensor_fail_fault": (bool(int(data[21])), "bool"),
-            "battery_short_fault": (bool(int(data[22])), "bool"),
-            "power_limit_warning": (bool(int(data[23])), "bool"),
-            "pv_voltage_high_warning": (bool(int(data[24])), "bool"),
-            "mppt_overload_fault": (bool(int(data[25])), "bool"),
-            "mppt_overload_warning": (bool(int(data[26])), "bool"),
-            "battery_too_low_to_charge_warning": (bool(int(data[27])), "bool"),
+            name: bit == "1"
+            for name, bit in zip(_QPIWS_NAMES, data)
+            if name is not None
+        }
+
+        return warnings, {key: "bool" for key in warnings}
+
+    def _parse_qpiri(self, data: str) -> tuple[dict[str, Any], dict[str, str]]:
+        """Parse QPIRI (device rating information) command response."""
+        if not data:
+            return {}, {}
+
+        values = data.split()
+        if len(values) < 12:
+            _LOGGER.warning("QPIRI response too short: %s", data)
+            return {}, {}
+
+        parsed = {
+            "grid_rating_voltage": float(values[0]),
+            "grid_rating_current": float(values[1]),
+            "ac_output_rating_voltage": float(values[2]),
+            "ac_output_rating_frequency": float(values[3]),
+            "ac_output_rating_current": float(values[4]),
+            "ac_output_rating_apparent_power": int(values[5]),
+            "ac_output_rating_active_power": int(values[6]),
+            "battery_rating_voltage": float(values[7]),
+            "battery_recharge_voltage": float(values[8]),
+            "battery_under_voltage": float(values[9]),
+            "battery_bulk_voltage": float(values[10]),
+            "battery_float_voltage": float(values[11]),
         }
-        
-        return warnings
-
-    def get_all_data(self) -> dict[str, Any]:
-        """Get all available data from the device."""
-        all_data = {}
-        
-        # Get QPIGS data (main status)
+        units = {
+            "grid_rating_voltage": "V",
+            "grid_rating_current": "A",
+            "ac_output_rating_voltage": "V",
+            "ac_output_rating_frequency": "Hz",
+            "ac_output_rating_current": "A",
+            "ac_output_rating_apparent_power": "VA",
+            "ac_output_rating_active_power": "W",
+            "battery_rating_voltage": "V",
+            "battery_recharge_voltage": "V",
+            "battery_under_voltage": "V",
+            "battery_bulk_voltage": "V",
+            "battery_float_voltage": "V",
+        }
+
+        return parsed, units
+
+    def get_rating_data(self) -> dict[str, dict[str, Any]]:
+        """Get the (rarely changing) device rating information."""
+        values: dict[str, Any] = {}
+        units: dict[str, str] = {}
+
         try:
-            qpigs_response = self._send_command("QPIGS")
-            if qpigs_response:
-                qpigs_data = self._parse_qpigs(qpigs_response)
-                all_data.update(qpigs_data)
+            qpiri_response = self._send_command("QPIRI")
+            if qpiri_response:
+                values, units = self._parse_qpiri(qpiri_response)
         except Exception as e:
-            _LOGGER.error("Failed to get QPIGS data: %s", e)
-        
-        # Get warning status
+            _LOGGER.error("Failed to get QPIRI data: %s", e)
+
+        return {"values": values, "units": units}
+
+    def get_runtime_data(self) -> dict[str, dict[str, Any]]:
+        """Get the fast-changing runtime data, as parallel value/unit dicts."""
+        values: dict[str, Any] = {}
+        units: dict[str, str] = {}
+
+        # QPIGS (main status) and QPIWS (warnings) ride one pipelined
+        # exchange - a single write burst and read pass instead of two
+        # full round-trips
+        qpigs_response, qpiws_response = self._send_commands_pipelined(
+            ["QPIGS", "QPIWS"]
+        )
+
         try:
-            qpiws_response = self._send_command("QPIWS")
-            if qpiws_response:
-                qpiws_data = self._parse_qpiws(qpiws_response)
-                all_data.update(qpiws_data)
+            if qpigs_response:
+                qpigs_values, qpigs_units = self._parse_qpigs(qpigs_response)
+                values.update(qpigs_values)
+                units.update(qpigs_units)
         except Exception as e:
-            _LOGGER.error("Failed to get QPIWS data: %s", e)
-        
-        # Get device mode
+            _LOGGER.error("Failed to parse QPIGS data: %s", e)
+
         try:
-            mode_response = self._send_command("QMOD")
-            if mode_response:
-                all_data["device_mode"] = (mode_response.strip(), "")
+            if qpiws_response:
+                qpiws_values, qpiws_units = self._parse_qpiws(qpiws_response)
+                values.update(qpiws_values)
+                units.update(qpiws_units)
         except Exception as e:
-            _LOGGER.error("Failed to get device mode: %s", e)
-        
-        return all_data
+            _LOGGER.error("Failed to parse QPIWS data: %s", e)
+
+        # Get device mode - it changes rarely, so serve it from a short
+        # TTL cache and skip the serial round-trip on most polls
+        if (
+            self._mode_cache is not None
+            and time.monotonic() - self._mode_cache[1] < _MODE_CACHE_TTL
+        ):
+            values["device_mode"] = self._mode_cache[0]
+            units["device_mode"] = ""
+        else:
+            try:
+                mode_response = self._send_command("QMOD")
+                if mode_response:
+                    mode = mode_response.strip()
+                    self._mode_cache = (mode, time.monotonic())
+                    values["device_mode"] = mode
+                    units["device_mode"] = ""
+            except Exception as e:
+                _LOGGER.error("Failed to get device mode: %s", e)
+
+        return {"values": values, "units": units}
+
+    def get_all_data(self) -> dict[str, dict[str, Any]]:
+        """Get all available data (runtime and rating) in one pass."""
+        data = self.get_runtime_data()
+        ratings = self.get_rating_data()
+        data["values"].update(ratings["values"])
+        data["units"].update(ratings["units"])
+        return data
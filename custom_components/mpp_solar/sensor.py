@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import NamedTuple
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -16,7 +20,7 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -33,117 +37,185 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
-    _LOGGER.info("🏗️ Setting up MPP Solar sensors")
-    
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    api = hass.data[DOMAIN][config_entry.entry_id]["api"]
-    
-    # Get device info
-    try:
-        device_info = await hass.async_add_executor_job(api.get_device_info)
-        _LOGGER.info("📄 Device info: %s", device_info)
-    except Exception as e:
-        _LOGGER.warning("⚠️ Could not get device info: %s", e)
-        device_info = {"serial_number": "unknown", "firmware_version": "Unknown"}
-    
-    entities = []
+    _LOGGER.debug("🏗️ Setting up MPP Solar sensors")
     
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    # Device info was fetched once during setup - no extra serial round-trip
+    device_info = entry_data["device_info"]
+
+    # One shared registry dict for every entity instead of a copy per entity
+    shared_device_info = {
+        "identifiers": {(DOMAIN, device_info.get("serial_number", "unknown"))},
+        "name": "MPP Solar Inverter",
+        "manufacturer": "MPP Solar",
+        "model": "PIP5048MG",
+        "sw_version": device_info.get("firmware_version", "Unknown"),
+    }
+
+    values = coordinator.data["values"] if coordinator.data else {}
+
     # Pokud nemáme data, vytvořme alespoň testovací entity
-    if not coordinator.data:
+    if not values:
         _LOGGER.warning("⚠️ No coordinator data, creating basic sensors")
-        
+
         # Vytvoř základní senzory které budou čekat na data
-        basic_sensors = [
-            ("ac_output_voltage", "AC Output Voltage", "V", SensorDeviceClass.VOLTAGE),
-            ("battery_voltage", "Battery Voltage", "V", SensorDeviceClass.VOLTAGE),
-            ("ac_output_active_power", "AC Output Power", "W", SensorDeviceClass.POWER),
-            ("battery_capacity", "Battery Capacity", "%", SensorDeviceClass.BATTERY),
-            ("pv_input_voltage", "PV Voltage", "V", SensorDeviceClass.VOLTAGE),
-        ]
-        
-        for sensor_key, name, unit, device_class in basic_sensors:
-            entities.append(
-                MPPSolarSensor(
-                    coordinator=coordinator,
-                    key=sensor_key,
-                    name=name,
-                    unit=unit,
-                    device_info=device_info,
-                    device_class=device_class,
-                )
+        async_add_entities(
+            MPPSolarSensor(
+                coordinator=coordinator,
+                key=sensor_key,
+                name=sensor_key.replace("_", " ").title(),
+                unit=unit,
+                device_info=shared_device_info,
+                description=_DESCRIPTIONS[sensor_key],
             )
-        
-        _LOGGER.info("✅ Created %d basic sensors", len(entities))
-        
-    else:
-        _LOGGER.info("📊 Processing coordinator data: %d items", len(coordinator.data))
-        
-        # Zpracovat existující data
-        for key, value_info in coordinator.data.items():
-            _LOGGER.debug("🔍 Processing key: %s, value: %s", key, value_info)
-            
-            # Zkusit různé formáty dat
-            unit = None
-            value = None
-            
-            if isinstance(value_info, tuple) and len(value_info) >= 2:
-                value, unit = value_info[0], value_info[1]
-            elif isinstance(value_info, (int, float)):
-                value = value_info
-                unit = ""
-            elif isinstance(value_info, str):
-                value = value_info
-                unit = ""
-            else:
-                _LOGGER.debug("⚠️ Skipping unknown value format for %s: %s", key, value_info)
-                continue
-            
-            # Skip boolean values (they go to binary_sensor)
-            if unit == "bool" or isinstance(value, bool):
-                continue
-            
-            # Only create sensors for numeric values
-            if isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit()):
-                device_class = _get_device_class(unit, key)
-                
-                entities.append(
-                    MPPSolarSensor(
-                        coordinator=coordinator,
-                        key=key,
-                        name=key.replace("_", " ").title(),
-                        unit=unit,
-                        device_info=device_info,
-                        device_class=device_class,
-                    )
-                )
-        
-        _LOGGER.info("✅ Created %d sensors from data", len(entities))
-    
-    if entities:
-        async_add_entities(entities)
-        _LOGGER.info("🎉 Successfully added %d sensor entities", len(entities))
+            for sensor_key, unit in _BASIC_SENSORS
+        )
+        return
+
+    _LOGGER.debug("📊 Processing coordinator data: %d items", len(values))
+
+    # Stream entities into HA as they are built instead of collecting a list
+    async_add_entities(_iter_sensors(coordinator, shared_device_info))
+
+
+def _iter_sensors(coordinator, shared_device_info):
+    """Yield a sensor for every numeric key in the coordinator data."""
+    values = coordinator.data["values"]
+    units = coordinator.data["units"]
+
+    # Checked once here so the per-key debug call costs nothing when
+    # debug logging is off
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    count = 0
+    for key, value in values.items():
+        unit = units.get(key, "")
+        if debug_enabled:
+            _LOGGER.debug("🔍 Processing key: %s, value: %s %s", key, value, unit)
+
+        # Booleans go to binary_sensor - the isinstance check comes first
+        # because bool is an int subclass and would slip through the
+        # numeric test below
+        if isinstance(value, bool) or unit == "bool":
+            continue
+
+        # Only create sensors for numeric values - the API layer
+        # already delivers typed values, so no string sniffing needed
+        if not isinstance(value, (int, float)):
+            continue
+
+        # Known keys use the description precomputed at import; only
+        # unexpected keys pay the (single-pass) dynamic classification
+        description = _DESCRIPTIONS.get(key)
+        classification = None if description else _classify(unit, key.lower())
+
+        count += 1
+        yield MPPSolarSensor(
+            coordinator=coordinator,
+            key=key,
+            name=key.replace("_", " ").title(),
+            unit=unit,
+            device_info=shared_device_info,
+            classification=classification,
+            description=description,
+        )
+
+    if count:
+        _LOGGER.debug("🎉 Created %d sensors from data", count)
     else:
         _LOGGER.error("❌ No entities were created!")
 
-def _get_device_class(unit: str, key: str) -> SensorDeviceClass | None:
-    """Get device class based on unit and key."""
-    if unit == "W" or unit == "VA":
-        return SensorDeviceClass.POWER
-    elif unit == "V":
-        return SensorDeviceClass.VOLTAGE
-    elif unit == "A":
-        return SensorDeviceClass.CURRENT
-    elif unit == "°C":
-        return SensorDeviceClass.TEMPERATURE
-    elif unit == "Hz":
-        return SensorDeviceClass.FREQUENCY
-    elif unit == "%" and "battery" in key.lower():
-        return SensorDeviceClass.BATTERY
-    return None
+# Classifier tables shared by every entity - built once at import
+# instead of a dict literal or if/elif ladder per call
+_UNIT_MAP = {
+    "V": UnitOfElectricPotential.VOLT,
+    "A": UnitOfElectricCurrent.AMPERE,
+    "W": UnitOfPower.WATT,
+    "VA": "VA",
+    "Hz": UnitOfFrequency.HERTZ,
+    "°C": UnitOfTemperature.CELSIUS,
+    "%": PERCENTAGE,
+}
+
+_DEVICE_CLASS_MAP = {
+    "W": SensorDeviceClass.POWER,
+    "VA": SensorDeviceClass.POWER,
+    "V": SensorDeviceClass.VOLTAGE,
+    "A": SensorDeviceClass.CURRENT,
+    "°C": SensorDeviceClass.TEMPERATURE,
+    "Hz": SensorDeviceClass.FREQUENCY,
+}
+
+_MEASUREMENT_UNITS = frozenset({"W", "VA", "V", "A", "°C", "Hz", "%"})
+
+# Icon per key token, checked in priority order before the unit fallback
+_TOKEN_ICONS = (
+    ("battery", "mdi:battery"),
+    ("pv", "mdi:solar-panel"),
+    ("solar", "mdi:solar-panel"),
+    ("inverter", "mdi:power-plug"),
+    ("load", "mdi:chart-line"),
+)
+
+_UNIT_ICONS = {
+    "W": "mdi:flash",
+    "VA": "mdi:flash",
+    "V": "mdi:lightning-bolt",
+    "A": "mdi:current-ac",
+    "°C": "mdi:thermometer",
+    "Hz": "mdi:sine-wave",
+}
+
+
+class _Classification(NamedTuple):
+    """Presentation attributes resolved for one sensor key."""
+
+    device_class: SensorDeviceClass | None
+    ha_unit: str
+    state_class: SensorStateClass | None
+    icon: str
+
+
+@lru_cache(maxsize=64)
+def _classify(unit: str, key_lower: str) -> _Classification:
+    """Resolve device class, HA unit, state class and icon in one pass.
+
+    Fusing the four former helpers means one call and one lower-cased
+    key per sensor instead of four of each; the cache makes repeat
+    classifications across reloads free.
+    """
+    # Keys are underscore-separated, so exact token membership replaces
+    # the former substring scans (same matches, hashed lookups)
+    tokens = frozenset(key_lower.split("_"))
+
+    device_class = _DEVICE_CLASS_MAP.get(unit)
+    if device_class is None and unit == "%" and "battery" in tokens:
+        device_class = SensorDeviceClass.BATTERY
+
+    icon = None
+    for token, token_icon in _TOKEN_ICONS:
+        if token in tokens:
+            icon = token_icon
+            break
+    if icon is None:
+        icon = _UNIT_ICONS.get(unit, "mdi:gauge")
+
+    return _Classification(
+        device_class,
+        _UNIT_MAP.get(unit, unit),
+        SensorStateClass.MEASUREMENT if unit in _MEASUREMENT_UNITS else None,
+        icon,
+    )
 
 class MPPSolarSensor(CoordinatorEntity, SensorEntity):
     """Representation of an MPP Solar sensor."""
 
+    # The HA base entities still provide __dict__, but slotting our own
+    # attributes keeps them out of it for large entity counts
+    __slots__ = ("_key", "_unit")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -151,107 +223,123 @@ class MPPSolarSensor(CoordinatorEntity, SensorEntity):
         name: str,
         unit: str,
         device_info: dict,
-        device_class: SensorDeviceClass | None = None,
+        classification: _Classification | None = None,
+        description: SensorEntityDescription | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._key = key
-        self._attr_name = f"MPP Solar {name}"
-        self._attr_unique_id = f"mpp_solar_{key}"
+        self._attr_unique_id = "mpp_solar_" + key
         self._unit = unit
-        
-        _LOGGER.debug("🔧 Creating sensor: %s (key: %s, unit: %s)", self._attr_name, key, unit)
-        
-        # Set device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_info.get("serial_number", "unknown"))},
-            "name": "MPP Solar Inverter",
-            "manufacturer": "MPP Solar",
-            "model": "PIP5048MG",
-            "sw_version": device_info.get("firmware_version", "Unknown"),
-        }
-        
-        # Set unit of measurement
+
+        # Seed the pushed value; _handle_coordinator_update keeps it fresh
+        self._attr_native_value = self._current_value()
+
+        # Shared device info dict built once in async_setup_entry; HA treats
+        # it as read-only so one reference serves every entity
+        self._attr_device_info = device_info
+
+        if description is not None:
+            # Known key: HA reads name, unit, device/state class and icon
+            # straight off the shared description - nothing to classify
+            self.entity_description = description
+            return
+
+        self._attr_name = "MPP Solar " + name
+
+        # Unknown key without a precomputed classification - resolve it
+        # here (one fused pass)
+        if classification is None:
+            classification = _classify(unit, key.lower())
+
         if unit:
-            self._attr_native_unit_of_measurement = _get_ha_unit(unit)
-        
-        # Set device class
-        if device_class:
-            self._attr_device_class = device_class
-        
-        # Set state class
-        self._attr_state_class = _get_state_class(unit)
-        
-        # Set icon
-        self._attr_icon = _get_icon(unit, key)
+            self._attr_native_unit_of_measurement = classification.ha_unit
+        if classification.device_class:
+            self._attr_device_class = classification.device_class
+        self._attr_state_class = classification.state_class
+        self._attr_icon = classification.icon
 
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the native value of the sensor."""
-        if not self.coordinator.data:
-            _LOGGER.debug("📭 No coordinator data for %s", self._key)
-            return None
-            
-        if self._key not in self.coordinator.data:
-            _LOGGER.debug("🔍 Key %s not found in coordinator data", self._key)
+    def _current_value(self) -> float | int | str | None:
+        """Read this sensor's value out of the coordinator data."""
+        data = self.coordinator.data
+        if not data:
             return None
-            
-        value_info = self.coordinator.data[self._key]
-        
-        # Handle different data formats
-        if isinstance(value_info, tuple) and len(value_info) >= 1:
-            return value_info[0]
-        elif isinstance(value_info, (int, float, str)):
-            return value_info
-        
-        _LOGGER.debug("⚠️ Unknown value format for %s: %s", self._key, value_info)
-        return None
+        return data["values"].get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Extract the value once per coordinator tick (push model).
+
+        HA then reads the stored attribute on every state access instead
+        of re-walking the coordinator dicts per read.
+        """
+        self._attr_native_value = self._current_value()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
-def _get_ha_unit(unit: str) -> str:
-    """Convert unit to Home Assistant unit."""
-    unit_mapping = {
-        "V": UnitOfElectricPotential.VOLT,
-        "A": UnitOfElectricCurrent.AMPERE,
-        "W": UnitOfPower.WATT,
-        "VA": "VA",
-        "Hz": UnitOfFrequency.HERTZ,
-        "°C": UnitOfTemperature.CELSIUS,
-        "%": PERCENTAGE,
-    }
-    return unit_mapping.get(unit, unit)
+# The numeric keys QPIGS and QPIRI deliver every cycle, with their units
+_KNOWN_SENSOR_KEYS = (
+    ("ac_input_voltage", "V"),
+    ("ac_input_frequency", "Hz"),
+    ("ac_output_voltage", "V"),
+    ("ac_output_frequency", "Hz"),
+    ("ac_output_apparent_power", "VA"),
+    ("ac_output_active_power", "W"),
+    ("ac_output_load", "%"),
+    ("bus_voltage", "V"),
+    ("battery_voltage", "V"),
+    ("battery_charging_current", "A"),
+    ("battery_capacity", "%"),
+    ("inverter_heat_sink_temperature", "°C"),
+    ("pv_input_current_for_battery", "A"),
+    ("pv_input_voltage", "V"),
+    ("battery_voltage_from_scc", "V"),
+    ("battery_discharge_current", "A"),
+    ("pv_input_power", "W"),
+    ("grid_rating_voltage", "V"),
+    ("grid_rating_current", "A"),
+    ("ac_output_rating_voltage", "V"),
+    ("ac_output_rating_frequency", "Hz"),
+    ("ac_output_rating_current", "A"),
+    ("ac_output_rating_apparent_power", "VA"),
+    ("ac_output_rating_active_power", "W"),
+    ("battery_rating_voltage", "V"),
+    ("battery_recharge_voltage", "V"),
+    ("battery_under_voltage", "V"),
+    ("battery_bulk_voltage", "V"),
+    ("battery_float_voltage", "V"),
+)
 
-def _get_state_class(unit: str) -> SensorStateClass | None:
-    """Get state class based on unit."""
-    if unit in ["W", "VA", "V", "A", "°C", "Hz", "%"]:
-        return SensorStateClass.MEASUREMENT
-    return None
 
-def _get_icon(unit: str, key: str) -> str:
-    """Get icon based on unit and key."""
-    key_lower = key.lower()
-    
-    if "battery" in key_lower:
-        return "mdi:battery"
-    elif "pv" in key_lower or "solar" in key_lower:
-        return "mdi:solar-panel"
-    elif "inverter" in key_lower:
-        return "mdi:power-plug"
-    elif "load" in key_lower:
-        return "mdi:chart-line"
-    elif unit == "W" or unit == "VA":
-        return "mdi:flash"
-    elif unit == "V":
-        return "mdi:lightning-bolt"
-    elif unit == "A":
-        return "mdi:current-ac"
-    elif unit == "°C":
-        return "mdi:thermometer"
-    elif unit == "Hz":
-        return "mdi:sine-wave"
-    
-    return "mdi:gauge"
+def _build_description(key: str, unit: str) -> SensorEntityDescription:
+    """Resolve a known key's presentation attributes once at import."""
+    classification = _classify(unit, key)
+    return SensorEntityDescription(
+        key=key,
+        name="MPP Solar " + key.replace("_", " ").title(),
+        native_unit_of_measurement=classification.ha_unit,
+        device_class=classification.device_class,
+        state_class=classification.state_class,
+        icon=classification.icon,
+    )
+
+
+# Immutable descriptions for the closed key set - entities for known
+# keys skip all per-instance classification at setup
+_DESCRIPTIONS = {
+    key: _build_description(key, unit) for key, unit in _KNOWN_SENSOR_KEYS
+}
+
+# Fallback entities created when the first refresh brought no data; they
+# reuse the shared descriptions and fill in once values arrive
+_BASIC_SENSORS = (
+    ("ac_output_voltage", "V"),
+    ("battery_voltage", "V"),
+    ("ac_output_active_power", "W"),
+    ("battery_capacity", "%"),
+    ("pv_input_voltage", "V"),
+)